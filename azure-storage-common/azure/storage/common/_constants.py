@@ -7,7 +7,7 @@ import platform
 import sys
 
 __author__ = 'Microsoft Corp. <ptvshelp@microsoft.com>'
-__version__ = '2.1.0'
+__version__ = '2.2.0'
 
 # UserAgent string sample: 'Azure-Storage/0.37.0-0.38.0 (Python CPython 3.4.2; Windows 8)'
 # First version(0.37.0) is the common package, and the second version(0.38.0) is the service package
@@ -50,3 +50,4 @@ _AUTHORIZATION_HEADER_NAME = 'Authorization'
 _COPY_SOURCE_HEADER_NAME = 'x-ms-copy-source'
 _REDACTED_VALUE = 'REDACTED'
 _CLIENT_REQUEST_ID_HEADER_NAME = 'x-ms-client-request-id'
+_METADATA_HEADER_PREFIX = 'x-ms-meta-'
@@ -3,14 +3,47 @@
 # Licensed under the MIT License. See License.txt in the project root for
 # license information.
 # --------------------------------------------------------------------------
+from datetime import datetime
+
 from dateutil import parser
+from dateutil.tz import tzutc
+
+try:
+    import ciso8601
+except ImportError:
+    ciso8601 = None
+
+try:
+    from email.utils import parsedate_to_datetime
+except ImportError:
+    # Python 2
+    parsedate_to_datetime = None
 
 from ._common_conversion import _to_str
+from ._constants import _METADATA_HEADER_PREFIX
 
 try:
-    from xml.etree import cElementTree as ETree
+    from lxml import etree as ETree
+
+    # Service responses never use DTDs, entities or ids. Entity resolution, DTD
+    # loading and network access stay off on every lxml version so a response can't
+    # read local files or URLs through external entities. Whitespace between
+    # elements and comments are dropped rather than kept as nodes.
+    _XML_PARSER_OPTIONS = {
+        'resolve_entities': False,
+        'load_dtd': False,
+        'no_network': True,
+        'collect_ids': False,
+        'remove_blank_text': True,
+        'remove_comments': True,
+    }
 except ImportError:
-    from xml.etree import ElementTree as ETree
+    try:
+        from xml.etree import cElementTree as ETree
+    except ImportError:
+        from xml.etree import ElementTree as ETree
+
+    _XML_PARSER_OPTIONS = {}
 
 from .models import (
     ServiceProperties,
@@ -23,9 +56,137 @@ from .models import (
     ServiceStats,
     DeleteRetentionPolicy,
     StaticWebsite,
+    _unicode_type,
 )
 
 
+# An lxml parser can be reused for every response (it is locked while parsing), so
+# its setup is not repeated per call. ElementTree parsers can only be used once.
+_XML_PARSER = ETree.XMLParser(**_XML_PARSER_OPTIONS) if _XML_PARSER_OPTIONS else None
+
+
+def _encode_xml_body(body):
+    '''
+    Returns the UTF-8 encoding of a text XML response body. lxml rejects text that
+    carries an encoding declaration, so bodies are always parsed as bytes.
+    '''
+    if isinstance(body, _unicode_type):
+        return body.encode('utf-8')
+    return body
+
+
+def _fromstring(body):
+    '''
+    Parses an XML response body.
+    '''
+    return ETree.fromstring(_encode_xml_body(body), _XML_PARSER)
+
+
+# Dates in UTC are returned with the tzutc() tzinfo dateutil uses for 'Z' and 'GMT',
+# whichever parser read them, so they match the dates parsed by the other packages.
+# dateutil itself returns tzlocal() for a zero offset when the local time zone is UTC.
+_UTC = tzutc()
+
+
+# Parses dates with dateutil, caching the results by their raw string since
+# responses often repeat the same timestamps (eg. for resources created together).
+# The fixed-format parsers below handle the service's dates on Python 3, so this is
+# only reached on Python 2 and for values they reject. The cache is not an LRU: it
+# is cleared once it is full, which keeps its size bounded at little cost.
+_DATETIME_CACHE = {}
+_DATETIME_CACHE_MAX_SIZE = 4096
+
+
+def _parse_datetime(value, ignoretz=False):
+    key = (value, ignoretz)
+    try:
+        return _DATETIME_CACHE[key]
+    except KeyError:
+        pass
+
+    if len(_DATETIME_CACHE) >= _DATETIME_CACHE_MAX_SIZE:
+        _DATETIME_CACHE.clear()
+
+    result = parser.parse(value, ignoretz=ignoretz)
+    if result.tzinfo is not None and not result.utcoffset():
+        result = result.replace(tzinfo=_UTC)
+
+    _DATETIME_CACHE[key] = result
+    return result
+
+
+def _parse_http_date(value):
+    '''
+    Parses an RFC 1123 date, eg. 'Mon, 02 Jan 2006 15:04:05 GMT', as returned in the
+    Last-Modified header and the listing properties.
+    '''
+    if parsedate_to_datetime is not None:
+        try:
+            result = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            pass
+        else:
+            # A '-0000' offset is returned as a naive datetime, but is also in UTC
+            if result.tzinfo is None or not result.utcoffset():
+                return result.replace(tzinfo=_UTC)
+
+    return _parse_datetime(value)
+
+
+def _parse_iso_z(value, tzinfo):
+    '''
+    Parses the shape the service uses for UTC ISO 8601 dates,
+    'YYYY-MM-DDTHH:MM:SS[.fffffff]Z', by slicing out the fields. Fractions beyond
+    microseconds are truncated. Raises ValueError for any other shape.
+    '''
+    length = len(value)
+    if length < 20 or value[-1] != 'Z' or value[4] != '-' or value[7] != '-' or value[10] != 'T' \
+            or value[13] != ':' or value[16] != ':':
+        raise ValueError('Unexpected date format: {}'.format(value))
+
+    microsecond = 0
+    if length > 20:
+        fraction = value[20:-1]
+        if value[19] != '.' or not fraction.isdigit():
+            raise ValueError('Unexpected date format: {}'.format(value))
+        microsecond = int(fraction[:6].ljust(6, '0'))
+
+    return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                    int(value[11:13]), int(value[14:16]), int(value[17:19]), microsecond, tzinfo)
+
+
+def _parse_iso(value):
+    '''
+    Parses an ISO 8601 date, eg. '2006-01-02T15:04:05.0000000Z', as used for access
+    policies and SMB properties.
+    '''
+    try:
+        if ciso8601 is None:
+            return _parse_iso_z(value, _UTC)
+
+        result = ciso8601.parse_datetime(value)
+        if result.tzinfo is None:
+            return result
+        if not result.utcoffset():
+            return result.replace(tzinfo=_UTC)
+    except ValueError:
+        pass
+
+    return _parse_datetime(value)
+
+
+def _parse_iso_ignoretz(value):
+    '''
+    Parses an ISO 8601 date as a naive :class:`datetime`, ignoring its time zone.
+    '''
+    try:
+        if ciso8601 is not None:
+            return ciso8601.parse_datetime_as_naive(value)
+        return _parse_iso_z(value, None)
+    except ValueError:
+        return _parse_datetime(value, ignoretz=True)
+
+
 def _to_int(value):
     return value if value is None else int(value)
 
@@ -34,6 +195,21 @@ def _bool(value):
     return value.lower() == 'true'
 
 
+# Booleans in response bodies are serialized by the service as 'true' or 'false';
+# looking them up avoids lowercasing each value as _bool does.
+_BOOL_VALUES = {
+    'true': True,
+    'false': False,
+}
+
+
+def _lookup_bool(value):
+    try:
+        return _BOOL_VALUES[value]
+    except KeyError:
+        return _bool(value)
+
+
 def _to_upper_str(value):
     return _to_str(value).upper() if value is not None else None
 
@@ -50,7 +226,7 @@ def _get_download_size(start_range, end_range, resource_size):
 
 
 GET_PROPERTIES_ATTRIBUTE_MAP = {
-    'last-modified': (None, 'last_modified', parser.parse),
+    'last-modified': (None, 'last_modified', _parse_http_date),
     'etag': (None, 'etag', _to_str),
     'x-ms-blob-type': (None, 'blob_type', _to_str),
     'content-length': (None, 'content_length', _to_int),
@@ -59,13 +235,13 @@ GET_PROPERTIES_ATTRIBUTE_MAP = {
     'x-ms-blob-committed-block-count': (None, 'append_blob_committed_block_count', _to_int),
     'x-ms-blob-public-access': (None, 'public_access', _to_str),
     'x-ms-access-tier': (None, 'blob_tier', _to_str),
-    'x-ms-access-tier-change-time': (None, 'blob_tier_change_time', parser.parse),
+    'x-ms-access-tier-change-time': (None, 'blob_tier_change_time', _parse_http_date),
     'x-ms-access-tier-inferred': (None, 'blob_tier_inferred', _bool),
     'x-ms-archive-status': (None, 'rehydration_status', _to_str),
     'x-ms-share-quota': (None, 'quota', _to_int),
     'x-ms-server-encrypted': (None, 'server_encrypted', _bool),
     'x-ms-encryption-key-sha256': (None, 'encryption_key_sha256', _to_str),
-    'x-ms-creation-time': (None, 'creation_time', parser.parse),
+    'x-ms-creation-time': (None, 'creation_time', _parse_http_date),
     'content-type': ('content_settings', 'content_type', _to_str),
     'cache-control': ('content_settings', 'cache_control', _to_str),
     'content-encoding': ('content_settings', 'content_encoding', _to_str),
@@ -79,15 +255,15 @@ GET_PROPERTIES_ATTRIBUTE_MAP = {
     'x-ms-copy-source': ('copy', 'source', _to_str),
     'x-ms-copy-status': ('copy', 'status', _to_str),
     'x-ms-copy-progress': ('copy', 'progress', _to_str),
-    'x-ms-copy-completion-time': ('copy', 'completion_time', parser.parse),
+    'x-ms-copy-completion-time': ('copy', 'completion_time', _parse_http_date),
     'x-ms-copy-destination-snapshot': ('copy', 'destination_snapshot_time', _to_str),
     'x-ms-copy-status-description': ('copy', 'status_description', _to_str),
     'x-ms-has-immutability-policy': (None, 'has_immutability_policy', _bool),
     'x-ms-has-legal-hold': (None, 'has_legal_hold', _bool),
     'x-ms-file-attributes': ('smb_properties', 'ntfs_attributes', _to_str),
-    'x-ms-file-creation-time': ('smb_properties', 'creation_time', parser.parse, True),
-    'x-ms-file-last-write-time': ('smb_properties', 'last_write_time', parser.parse, True),
-    'x-ms-file-change-time': ('smb_properties', 'change_time', parser.parse, True),
+    'x-ms-file-creation-time': ('smb_properties', 'creation_time', _parse_iso_ignoretz),
+    'x-ms-file-last-write-time': ('smb_properties', 'last_write_time', _parse_iso_ignoretz),
+    'x-ms-file-change-time': ('smb_properties', 'change_time', _parse_iso_ignoretz),
     'x-ms-file-permission-key': ('smb_properties', 'permission_key', _to_str),
     'x-ms-file-id': ('smb_properties', 'file_id', _to_str),
     'x-ms-file-parent-id': ('smb_properties', 'parent_id', _to_str),
@@ -103,9 +279,11 @@ def _parse_metadata(response):
         return None
 
     metadata = _dict()
+    prefix = _METADATA_HEADER_PREFIX
+    prefix_length = len(prefix)
     for key, value in response.headers.items():
-        if key.lower().startswith('x-ms-meta-'):
-            metadata[key[10:]] = _to_str(value)
+        if key.lower().startswith(prefix):
+            metadata[key[prefix_length:]] = _to_str(value)
 
     return metadata
 
@@ -120,18 +298,18 @@ def _parse_properties(response, result_class):
         return None
 
     props = result_class()
+
+    # Header names are lowercased once by the http client, so each header needs a
+    # single lookup; there are fewer headers in a response than entries in the map.
     for key, value in response.headers.items():
         info = GET_PROPERTIES_ATTRIBUTE_MAP.get(key)
         if info:
-            if info[0] is None:
-                setattr(props, info[1], info[2](value))
+            group, name, conv = info
+            if group is None:
+                setattr(props, name, conv(value))
             else:
-                attr = getattr(props, info[0])
-                # if info[3] is True, time zones in parsed strings are ignored and a naive :class:`datetime` object
-                # will be returned.
-                ignoretz = info[3] if len(info) > 3 else False
-                header_value = info[2](value, ignoretz=ignoretz) if info[2] is parser.parse else info[2](value)
-                setattr(attr, info[1], header_value)
+                attr = getattr(props, group)
+                setattr(attr, name, conv(value))
 
     if hasattr(props, 'blob_type') and props.blob_type == 'PageBlob' and hasattr(props, 'blob_tier') and props.blob_tier is not None:
         props.blob_tier = _to_upper_str(props.blob_tier)
@@ -168,7 +346,7 @@ def _convert_xml_to_signed_identifiers(response):
     if response is None or response.body is None:
         return None
 
-    list_element = ETree.fromstring(response.body)
+    list_element = _fromstring(response.body)
     signed_identifiers = _dict()
 
     for signed_identifier_element in list_element.findall('SignedIdentifier'):
@@ -181,11 +359,11 @@ def _convert_xml_to_signed_identifiers(response):
         if access_policy_element is not None:
             start_element = access_policy_element.find('Start')
             if start_element is not None:
-                access_policy.start = parser.parse(start_element.text)
+                access_policy.start = _parse_iso(start_element.text)
 
             expiry_element = access_policy_element.find('Expiry')
             if expiry_element is not None:
-                access_policy.expiry = parser.parse(expiry_element.text)
+                access_policy.expiry = _parse_iso(expiry_element.text)
 
             access_policy.permission = access_policy_element.findtext('Permission')
 
@@ -207,7 +385,7 @@ def _convert_xml_to_service_stats(response):
     if response is None or response.body is None:
         return None
 
-    service_stats_element = ETree.fromstring(response.body)
+    service_stats_element = _fromstring(response.body)
 
     geo_replication_element = service_stats_element.find('GeoReplication')
 
@@ -276,20 +454,18 @@ def _convert_xml_to_service_properties(response):
     if response is None or response.body is None:
         return None
 
-    service_properties_element = ETree.fromstring(response.body)
+    service_properties_element = _fromstring(response.body)
     service_properties = ServiceProperties()
 
     # Logging
     logging = service_properties_element.find('Logging')
     if logging is not None:
         service_properties.logging = Logging()
-        service_properties.logging.version = logging.find('Version').text
-        service_properties.logging.delete = _bool(logging.find('Delete').text)
-        service_properties.logging.read = _bool(logging.find('Read').text)
-        service_properties.logging.write = _bool(logging.find('Write').text)
+        for element in logging:
+            setter = _LOGGING_SETTERS.get(element.tag)
+            if setter is not None:
+                setter(service_properties.logging, element)
 
-        _convert_xml_to_retention_policy(logging.find('RetentionPolicy'),
-                                         service_properties.logging.retention_policy)
     # HourMetrics
     hour_metrics_element = service_properties_element.find('HourMetrics')
     if hour_metrics_element is not None:
@@ -307,21 +483,19 @@ def _convert_xml_to_service_properties(response):
     if cors is not None:
         service_properties.cors = list()
         for rule in cors.findall('CorsRule'):
-            allowed_origins = rule.find('AllowedOrigins').text.split(',')
-
-            allowed_methods = rule.find('AllowedMethods').text.split(',')
-
-            max_age_in_seconds = int(rule.find('MaxAgeInSeconds').text)
-
-            cors_rule = CorsRule(allowed_origins, allowed_methods, max_age_in_seconds)
-
-            exposed_headers = rule.find('ExposedHeaders').text
-            if exposed_headers is not None:
-                cors_rule.exposed_headers = exposed_headers.split(',')
-
-            allowed_headers = rule.find('AllowedHeaders').text
-            if allowed_headers is not None:
-                cors_rule.allowed_headers = allowed_headers.split(',')
+            cors_rule = CorsRule(list(), list())
+            for element in rule:
+                tag = element.tag
+                if tag == 'AllowedOrigins':
+                    cors_rule.allowed_origins = _split_csv(element)
+                elif tag == 'AllowedMethods':
+                    cors_rule.allowed_methods = _split_csv(element)
+                elif tag == 'MaxAgeInSeconds':
+                    cors_rule.max_age_in_seconds = int(element.text)
+                elif tag == 'ExposedHeaders':
+                    cors_rule.exposed_headers = _split_csv(element)
+                elif tag == 'AllowedHeaders':
+                    cors_rule.allowed_headers = _split_csv(element)
 
             service_properties.cors.append(cors_rule)
 
@@ -334,7 +508,7 @@ def _convert_xml_to_service_properties(response):
     delete_retention_policy_element = service_properties_element.find('DeleteRetentionPolicy')
     if delete_retention_policy_element is not None:
         service_properties.delete_retention_policy = DeleteRetentionPolicy()
-        policy_enabled = _bool(delete_retention_policy_element.find('Enabled').text)
+        policy_enabled = _lookup_bool(delete_retention_policy_element.find('Enabled').text)
         service_properties.delete_retention_policy.enabled = policy_enabled
 
         if policy_enabled:
@@ -344,7 +518,7 @@ def _convert_xml_to_service_properties(response):
     static_website_element = service_properties_element.find('StaticWebsite')
     if static_website_element is not None:
         service_properties.static_website = StaticWebsite()
-        service_properties.static_website.enabled = _bool(static_website_element.find('Enabled').text)
+        service_properties.static_website.enabled = _lookup_bool(static_website_element.find('Enabled').text)
 
         index_document_element = static_website_element.find('IndexDocument')
         if index_document_element is not None:
@@ -357,6 +531,47 @@ def _convert_xml_to_service_properties(response):
     return service_properties
 
 
+def _split_csv(element):
+    '''
+    Splits the comma separated values of an element, stripping the whitespace
+    around each value.
+    '''
+    if not element.text:
+        return list()
+    return [value.strip() for value in element.text.split(',')]
+
+
+def _set_logging_version(logging, element):
+    logging.version = element.text
+
+
+def _set_logging_delete(logging, element):
+    logging.delete = _lookup_bool(element.text)
+
+
+def _set_logging_read(logging, element):
+    logging.read = _lookup_bool(element.text)
+
+
+def _set_logging_write(logging, element):
+    logging.write = _lookup_bool(element.text)
+
+
+def _set_logging_retention_policy(logging, element):
+    _convert_xml_to_retention_policy(element, logging.retention_policy)
+
+
+# Setters for the children of the Logging element, so the element is read in a
+# single pass over its children instead of a find per value.
+_LOGGING_SETTERS = {
+    'Version': _set_logging_version,
+    'Delete': _set_logging_delete,
+    'Read': _set_logging_read,
+    'Write': _set_logging_write,
+    'RetentionPolicy': _set_logging_retention_policy,
+}
+
+
 def _convert_xml_to_metrics(xml, metrics):
     '''
     <Version>version-number</Version>
@@ -371,12 +586,12 @@ def _convert_xml_to_metrics(xml, metrics):
     metrics.version = xml.find('Version').text
 
     # Enabled
-    metrics.enabled = _bool(xml.find('Enabled').text)
+    metrics.enabled = _lookup_bool(xml.find('Enabled').text)
 
     # IncludeAPIs
     include_apis_element = xml.find('IncludeAPIs')
     if include_apis_element is not None:
-        metrics.include_apis = _bool(include_apis_element.text)
+        metrics.include_apis = _lookup_bool(include_apis_element.text)
 
     # RetentionPolicy
     _convert_xml_to_retention_policy(xml.find('RetentionPolicy'), metrics.retention_policy)
@@ -388,7 +603,7 @@ def _convert_xml_to_retention_policy(xml, retention_policy):
     <Days>number-of-days</Days>
     '''
     # Enabled
-    retention_policy.enabled = _bool(xml.find('Enabled').text)
+    retention_policy.enabled = _lookup_bool(xml.find('Enabled').text)
 
     # Days
     days_element = xml.find('Days')
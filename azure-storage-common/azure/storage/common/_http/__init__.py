@@ -13,8 +13,8 @@ class HTTPError(Exception):
         the status code of the response
     :ivar str message:
         the message
-    :ivar list headers:
-        the returned headers, as a list of (name, value) pairs
+    :ivar dict headers:
+        the returned headers
     :ivar bytes body:
         the body of the response
     '''
@@ -69,6 +69,6 @@ class HTTPRequest(object):
         self.host = ''
         self.method = ''
         self.path = ''
-        self.query = {}  # list of (name, value)
-        self.headers = {}  # list of (header name, header value)
+        self.query = {}
+        self.headers = {}
         self.body = ''
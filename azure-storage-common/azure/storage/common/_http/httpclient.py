@@ -7,6 +7,7 @@
 import logging
 from . import HTTPResponse
 from .._serialization import _get_data_bytes_or_stream_only
+from .._constants import _METADATA_HEADER_PREFIX
 logger = logging.getLogger(__name__)
 
 
@@ -95,11 +96,13 @@ class _HTTPClient(object):
         status = int(response.status_code)
         response_headers = {}
         for key, name in response.headers.items():
+            lower_key = key.lower()
+
             # Preserve the case of metadata
-            if key.lower().startswith('x-ms-meta-'):
+            if lower_key.startswith(_METADATA_HEADER_PREFIX):
                 response_headers[key] = name
             else:
-                response_headers[key.lower()] = name
+                response_headers[lower_key] = name
 
         wrap = HTTPResponse(status, response.reason, response_headers, response.content)
         response.close()
@@ -34,7 +34,10 @@ from .models import (
 from ._common_conversion import (
     _str,
 )
-from ._constants import _CLIENT_REQUEST_ID_HEADER_NAME
+from ._constants import (
+    _CLIENT_REQUEST_ID_HEADER_NAME,
+    _METADATA_HEADER_PREFIX,
+)
 
 
 def _to_utc_datetime(value):
@@ -80,11 +83,24 @@ def _add_metadata_headers(metadata, request):
         if not request.headers:
             request.headers = {}
         for name, value in metadata.items():
-            request.headers['x-ms-meta-' + name] = value
+            request.headers[_METADATA_HEADER_PREFIX + name] = value
+
+
+# The date header only has a resolution of one second, so the formatted value is
+# reused by requests made within the same second. The pair is replaced as a whole
+# so concurrent requests never see a timestamp with another second's value.
+_last_date_header = (None, None)
 
 
 def _add_date_header(request):
-    current_time = format_date_time(time())
+    global _last_date_header
+
+    now = int(time())
+    timestamp, current_time = _last_date_header
+    if timestamp != now:
+        current_time = format_date_time(now)
+        _last_date_header = (now, current_time)
+
     request.headers['x-ms-date'] = current_time
 
 
@@ -60,49 +60,83 @@ class ListGenerator(Iterable):
     resources, the generator will have a populated next_marker field once it 
     finishes. This marker can be used to create a new generator if more 
     results are desired.
+
+    If prefetch is True, the next segment is requested on a worker thread once the
+    first result of the current segment has been consumed, while the rest of the
+    segment is being returned. Errors from that request are raised when the
+    generator reaches the next segment.
     '''
 
-    def __init__(self, resources, list_method, list_args, list_kwargs):
+    def __init__(self, resources, list_method, list_args, list_kwargs, prefetch=False):
         self.items = resources
         self.next_marker = resources.next_marker
 
         self._list_method = list_method
         self._list_args = list_args
         self._list_kwargs = list_kwargs
+        self._prefetch = prefetch
 
     def __iter__(self):
-        # return results
-        for i in self.items:
-            yield i
-
-        while True:
-            # if no more results on the service, return
-            if not self.next_marker:
-                break
-
-            # update the marker args
-            self._list_kwargs['marker'] = self.next_marker
-
-            # handle max results, if present
-            max_results = self._list_kwargs.get('max_results')
-            if max_results is not None:
-                max_results = max_results - len(self.items)
-
-                # if we've reached max_results, return
-                # else, update the max_results arg
-                if max_results <= 0:
-                    break
+        executor = None
+        next_segment = None
+        try:
+            while True:
+                # return results
+                for index, i in enumerate(self.items):
+                    yield i
+
+                    # if prefetching, request the next segment on a worker thread once the
+                    # caller has asked for more than the first result, so that fetching and
+                    # parsing the next segment overlaps with the caller's processing of this
+                    # one without a request being sent for a caller that stops early
+                    if index == 0 and self._prefetch and self._update_list_kwargs():
+                        if executor is None:
+                            import concurrent.futures
+                            executor = concurrent.futures.ThreadPoolExecutor(1)
+                        next_segment = executor.submit(self._list_method, *self._list_args, **self._list_kwargs)
+
+                # get the next segment
+                if next_segment is not None:
+                    resources = next_segment.result()
+                    next_segment = None
+                elif self._update_list_kwargs():
+                    resources = self._list_method(*self._list_args, **self._list_kwargs)
                 else:
-                    self._list_kwargs['max_results'] = max_results
+                    break
 
-            # get the next segment
-            resources = self._list_method(*self._list_args, **self._list_kwargs)
-            self.items = resources
-            self.next_marker = resources.next_marker
+                self.items = resources
+                self.next_marker = resources.next_marker
+        finally:
+            if next_segment is not None:
+                next_segment.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
 
-            # return results
-            for i in self.items:
-                yield i
+    def _update_list_kwargs(self):
+        '''
+        Updates the list args for the segment following the current one. Returns
+        False if there are no more results to return.
+        '''
+        # if no more results on the service, return
+        if not self.next_marker:
+            return False
+
+        # update the marker args
+        self._list_kwargs['marker'] = self.next_marker
+
+        # handle max results, if present
+        max_results = self._list_kwargs.get('max_results')
+        if max_results is not None:
+            max_results = max_results - len(self.items)
+
+            # if we've reached max_results, return
+            # else, update the max_results arg
+            if max_results <= 0:
+                return False
+            else:
+                self._list_kwargs['max_results'] = max_results
+
+        return True
 
 
 class RetryContext(object):
@@ -44,7 +44,7 @@ except ImportError:
 
 setup(
     name='azure-storage-common',
-    version='2.1.0',
+    version='2.2.0',
     description='Microsoft Azure Storage Common Client Library for Python',
     long_description=open('README.rst', 'r').read(),
     license='MIT License',
@@ -78,5 +78,7 @@ setup(
     ],
     extras_require={
         ":python_version<'3.0'": ['azure-storage-nspkg'],
+        'lxml': ['lxml'],
+        'ciso8601': ['ciso8601>=2.0'],
     }
 )
@@ -3,12 +3,10 @@
 # Licensed under the MIT License. See License.txt in the project root for
 # license information.
 # --------------------------------------------------------------------------
+import re
+
 from dateutil import parser
 
-try:
-    from xml.etree import cElementTree as ETree
-except ImportError:
-    from xml.etree import ElementTree as ETree
 from .models import (
     Share,
     Directory,
@@ -19,12 +17,13 @@ from .models import (
     ShareProperties,
     DirectoryProperties,
 )
-from azure.storage.common.models import (
-    _list,
-)
+from azure.storage.common.models import _list
 from azure.storage.common._deserialization import (
     _parse_properties,
     _parse_metadata,
+    _encode_xml_body,
+    _fromstring,
+    _parse_http_date,
 )
 from azure.storage.common._error import _validate_content_match
 from azure.storage.common._common_conversion import (
@@ -100,6 +99,13 @@ def _parse_file(response, name, validate_content=False):
     return File(name, response.body, props, metadata)
 
 
+# The service returns ranges and share stats as compact documents of a fixed shape,
+# so their values are matched directly and the document is only parsed as a
+# fallback if the body does not have that shape.
+_RANGE_RE = re.compile(br'<Range><Start>(\d+)</Start><End>(\d+)</End></Range>')
+_SHARE_USAGE_BYTES_RE = re.compile(br'<ShareUsageBytes>(\d+)</ShareUsageBytes>')
+
+
 def _convert_xml_to_shares(response):
     '''
     <?xml version="1.0" encoding="utf-8"?>
@@ -128,37 +134,41 @@ def _convert_xml_to_shares(response):
         return None
 
     shares = _list()
-    list_element = ETree.fromstring(response.body)
+    list_element = _fromstring(response.body)
 
     # Set next marker
     next_marker = list_element.findtext('NextMarker') or None
     setattr(shares, 'next_marker', next_marker)
 
     shares_element = list_element.find('Shares')
+    append = shares.append
 
     for share_element in shares_element.findall('Share'):
-        # Name element
         share = Share()
-        share.name = share_element.findtext('Name')
 
-        # Snapshot
-        share.snapshot = share_element.findtext('Snapshot')
-
-        # Metadata
-        metadata_root_element = share_element.find('Metadata')
-        if metadata_root_element is not None:
-            share.metadata = dict()
-            for metadata_element in metadata_root_element:
-                share.metadata[metadata_element.tag] = metadata_element.text
-
-        # Properties
-        properties_element = share_element.find('Properties')
-        share.properties.last_modified = parser.parse(properties_element.findtext('Last-Modified'))
-        share.properties.etag = properties_element.findtext('Etag')
-        share.properties.quota = int(properties_element.findtext('Quota'))
+        # Walk the children once rather than searching for each element
+        for element in share_element:
+            tag = element.tag
+            if tag == 'Name':
+                share.name = element.text
+            elif tag == 'Snapshot':
+                share.snapshot = element.text
+            elif tag == 'Properties':
+                for property_element in element:
+                    property_tag = property_element.tag
+                    if property_tag == 'Last-Modified':
+                        share.properties.last_modified = _parse_http_date(property_element.text)
+                    elif property_tag == 'Etag':
+                        share.properties.etag = property_element.text
+                    elif property_tag == 'Quota':
+                        share.properties.quota = int(property_element.text)
+            elif tag == 'Metadata':
+                share.metadata = dict()
+                for metadata_element in element:
+                    share.metadata[metadata_element.tag] = metadata_element.text
 
         # Add share to list
-        shares.append(share)
+        append(share)
 
     return shares
 
@@ -187,33 +197,43 @@ def _convert_xml_to_directories_and_files(response):
         return None
 
     entries = _list()
-    list_element = ETree.fromstring(response.body)
+    list_element = _fromstring(response.body)
 
     # Set next marker
     next_marker = list_element.findtext('NextMarker') or None
     setattr(entries, 'next_marker', next_marker)
 
     entries_element = list_element.find('Entries')
-
-    for file_element in entries_element.findall('File'):
-        # Name element
-        file = File()
-        file.name = file_element.findtext('Name')
-
-        # Properties
-        properties_element = file_element.find('Properties')
-        file.properties.content_length = int(properties_element.findtext('Content-Length'))
-
-        # Add file to list
-        entries.append(file)
-
-    for directory_element in entries_element.findall('Directory'):
-        # Name element
-        directory = Directory()
-        directory.name = directory_element.findtext('Name')
-
-        # Add directory to list
-        entries.append(directory)
+    directories = list()
+    append_file = entries.append
+    append_directory = directories.append
+
+    # Walk the entries once, keeping the directories to list them after all of the files
+    for element in entries_element:
+        tag = element.tag
+        if tag == 'File':
+            file = File()
+            for file_element in element:
+                file_tag = file_element.tag
+                if file_tag == 'Name':
+                    file.name = file_element.text
+                elif file_tag == 'Properties':
+                    for property_element in file_element:
+                        if property_element.tag == 'Content-Length':
+                            file.properties.content_length = int(property_element.text)
+
+            # Add file to list
+            append_file(file)
+        elif tag == 'Directory':
+            directory = Directory()
+            for directory_element in element:
+                if directory_element.tag == 'Name':
+                    directory.name = directory_element.text
+
+            # Add directory to list
+            append_directory(directory)
+
+    entries.extend(directories)
 
     return entries
 
@@ -241,7 +261,7 @@ def _convert_xml_to_handles(response):
         return None
 
     entries = _list()
-    list_element = ETree.fromstring(response.body)
+    list_element = _fromstring(response.body)
 
     # Set next marker
     next_marker = list_element.findtext('NextMarker') or None
@@ -299,15 +319,30 @@ def _convert_xml_to_ranges(response):
     if response is None or response.body is None:
         return None
 
+    # Use the matched ranges only if every range in the body was matched
+    body = _encode_xml_body(response.body)
+    matches = _RANGE_RE.findall(body)
+    if len(matches) == body.count(b'<Range>'):
+        return [FileRange(int(start), int(end)) for start, end in matches]
+
+    # Otherwise parse the document. The whole tree is held in memory, unlike when the
+    # ranges were streamed, but this fallback is rare and parsing it is several times
+    # faster; the matched path above never builds a tree.
     ranges = list()
-    ranges_element = ETree.fromstring(response.body)
+    append = ranges.append
+    ranges_element = _fromstring(body)
 
     for range_element in ranges_element.findall('Range'):
-        # Parse range
-        range = FileRange(int(range_element.findtext('Start')), int(range_element.findtext('End')))
+        # Parse range, reading the Start and End children in a single pass
+        start = end = None
+        for element in range_element:
+            if element.tag == 'Start':
+                start = int(element.text)
+            elif element.tag == 'End':
+                end = int(element.text)
 
         # Add range to list
-        ranges.append(range)
+        append(FileRange(start, end))
 
     return ranges
 
@@ -322,5 +357,10 @@ def _convert_xml_to_share_stats(response):
     if response is None or response.body is None:
         return None
 
-    share_stats_element = ETree.fromstring(response.body)
+    body = _encode_xml_body(response.body)
+    match = _SHARE_USAGE_BYTES_RE.search(body)
+    if match is not None:
+        return int(match.group(1))
+
+    share_stats_element = _fromstring(body)
     return int(share_stats_element.findtext('ShareUsageBytes'))
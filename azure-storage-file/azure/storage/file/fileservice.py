@@ -537,7 +537,8 @@ class FileService(StorageClient):
         return self._perform_request(request, _convert_xml_to_service_properties)
 
     def list_shares(self, prefix=None, marker=None, num_results=None,
-                    include_metadata=False, timeout=None, include_snapshots=False):
+                    include_metadata=False, timeout=None, include_snapshots=False,
+                    prefetch=False):
         '''
         Returns a generator to list the shares under the specified account.
         The generator will lazily follow the continuation tokens returned by
@@ -566,6 +567,12 @@ class FileService(StorageClient):
             The timeout parameter is expressed in seconds.
         :param bool include_snapshots:
             Specifies that share snapshots be returned in the response.
+        :param bool prefetch:
+            If True, the next segment of shares is requested on a worker thread once
+            the first share of the current segment has been consumed. The request
+            callbacks of the service are then called on that thread, and if the
+            generator is not iterated to the next segment, the request may still be
+            sent and its result is discarded.
         '''
         include = 'snapshots' if include_snapshots else None
         if include_metadata:
@@ -578,7 +585,7 @@ class FileService(StorageClient):
                   'include': include, 'timeout': timeout, '_context': operation_context}
         resp = self._list_shares(**kwargs)
 
-        return ListGenerator(resp, self._list_shares, (), kwargs)
+        return ListGenerator(resp, self._list_shares, (), kwargs, prefetch=prefetch)
 
     def _list_shares(self, prefix=None, marker=None, max_results=None,
                      include=None, timeout=None, _context=None):
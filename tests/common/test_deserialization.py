@@ -0,0 +1,234 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import os
+import tempfile
+import unittest
+from datetime import (
+    datetime,
+    timedelta,
+)
+
+from dateutil.tz import tzutc
+
+from azure.storage.common._deserialization import (
+    _convert_xml_to_service_properties,
+    _fromstring,
+    _lookup_bool,
+    _parse_http_date,
+    _parse_iso,
+    _parse_iso_ignoretz,
+    _parse_iso_z,
+)
+from azure.storage.common._http import HTTPResponse
+from tests.testcase import (
+    StorageTestCase,
+)
+
+# ------------------------------------------------------------------------------
+SERVICE_PROPERTIES_BODY = b'''<?xml version="1.0" encoding="utf-8"?>
+<StorageServiceProperties>
+  <Logging>
+    <Version>1.0</Version>
+    <Delete>true</Delete>
+    <Read>false</Read>
+    <Write>True</Write>
+    <RetentionPolicy>
+      <Enabled>false</Enabled>
+    </RetentionPolicy>
+  </Logging>
+  <Cors>
+    <CorsRule>
+      <AllowedOrigins>www.xyz.com, www.ab.com,www.bc.com</AllowedOrigins>
+      <AllowedMethods> GET ,PUT</AllowedMethods>
+      <MaxAgeInSeconds>500</MaxAgeInSeconds>
+      <ExposedHeaders>x-ms-meta-data*, x-ms-meta-source*,x-ms-meta-abc</ExposedHeaders>
+      <AllowedHeaders />
+    </CorsRule>
+    <CorsRule>
+      <AllowedOrigins>*</AllowedOrigins>
+      <AllowedMethods>GET</AllowedMethods>
+      <MaxAgeInSeconds>0</MaxAgeInSeconds>
+      <ExposedHeaders />
+      <AllowedHeaders>x-ms-meta-target*</AllowedHeaders>
+    </CorsRule>
+  </Cors>
+</StorageServiceProperties>'''
+
+
+# ------------------------------------------------------------------------------
+
+class StorageDeserializationTest(StorageTestCase):
+    # --Test cases for parsing XML ----------------------------------------------
+    def test_fromstring_does_not_resolve_external_entities(self):
+        # Arrange
+        handle, path = tempfile.mkstemp()
+        os.write(handle, b'secret file content')
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+        body = '<?xml version="1.0" encoding="utf-8"?>' \
+               '<!DOCTYPE SignedIdentifiers [<!ENTITY secret SYSTEM "file://{}">]>' \
+               '<SignedIdentifiers><Id>&secret;</Id></SignedIdentifiers>'.format(path.replace(os.sep, '/'))
+
+        # Act
+        try:
+            id = _fromstring(body).findtext('Id')
+        except SyntaxError:
+            # ElementTree raises a ParseError for entities it does not resolve
+            id = None
+
+        # Assert
+        self.assertFalse(id)
+
+    def test_fromstring_unicode_body(self):
+        # Arrange
+        body = u'<?xml version="1.0" encoding="utf-8"?><SignedIdentifiers><Id>été</Id></SignedIdentifiers>'
+
+        # Act
+        id = _fromstring(body).findtext('Id')
+
+        # Assert
+        self.assertEqual(id, u'été')
+
+    # --Test cases for parsing dates --------------------------------------------
+    def test_parse_http_date_returns_tzutc(self):
+        for value in ('Thu, 09 May 2019 01:33:47 GMT',
+                      'Thu, 09 May 2019 01:33:47 -0000',
+                      'Thu, 09 May 2019 01:33:47 +0000'):
+            # Act
+            date = _parse_http_date(value)
+
+            # Assert
+            self.assertEqual(date, datetime(2019, 5, 9, 1, 33, 47, tzinfo=tzutc()))
+            self.assertIsInstance(date.tzinfo, tzutc)
+
+    def test_parse_http_date_with_offset(self):
+        # Act
+        date = _parse_http_date('Thu, 09 May 2019 01:33:47 +0100')
+
+        # Assert
+        self.assertEqual(date.utcoffset(), timedelta(hours=1))
+        self.assertEqual(date, datetime(2019, 5, 9, 0, 33, 47, tzinfo=tzutc()))
+
+    def test_parse_iso_returns_tzutc(self):
+        for value in ('2019-05-09T01:33:47.1234560Z', '2019-05-09T01:33:47.123456+00:00'):
+            # Act
+            date = _parse_iso(value)
+
+            # Assert
+            self.assertEqual(date, datetime(2019, 5, 9, 1, 33, 47, 123456, tzinfo=tzutc()))
+            self.assertIsInstance(date.tzinfo, tzutc)
+
+    def test_parse_iso_with_offset_or_without_time_zone(self):
+        # Act
+        offset_date = _parse_iso('2019-05-09T01:33:47+01:00')
+        naive_date = _parse_iso('2019-05-09T01:33:47')
+
+        # Assert
+        self.assertEqual(offset_date.utcoffset(), timedelta(hours=1))
+        self.assertEqual(offset_date, datetime(2019, 5, 9, 0, 33, 47, tzinfo=tzutc()))
+        self.assertEqual(naive_date, datetime(2019, 5, 9, 1, 33, 47))
+        self.assertIsNone(naive_date.tzinfo)
+
+    def test_parse_iso_z(self):
+        # Act
+        date = _parse_iso_z('2019-05-09T01:33:47Z', tzutc())
+        naive_date = _parse_iso_z('2019-05-09T01:33:47Z', None)
+
+        # Assert
+        self.assertEqual(date, datetime(2019, 5, 9, 1, 33, 47, tzinfo=tzutc()))
+        self.assertEqual(naive_date, datetime(2019, 5, 9, 1, 33, 47))
+        self.assertIsNone(naive_date.tzinfo)
+
+    def test_parse_iso_z_fractions(self):
+        for value, microsecond in (('2019-05-09T01:33:47.1Z', 100000),
+                                   ('2019-05-09T01:33:47.000123Z', 123),
+                                   ('2019-05-09T01:33:47.1234567Z', 123456),
+                                   ('2019-05-09T01:33:47.9999999Z', 999999)):
+            # Act
+            date = _parse_iso_z(value, tzutc())
+
+            # Assert
+            self.assertEqual(date, datetime(2019, 5, 9, 1, 33, 47, microsecond, tzinfo=tzutc()))
+
+    def test_parse_iso_z_malformed(self):
+        for value in ('',
+                      '2019-05-09',
+                      '2019-05-09T01:33:47',
+                      '2019-05-09 01:33:47Z',
+                      '2019/05/09T01:33:47Z',
+                      '2019-05-09T01-33-47Z',
+                      '2019-05-09T01:33:47+00:00',
+                      '2019-05-09T01:33:47.Z',
+                      '2019-05-09T01:33:47,123Z',
+                      '2019-05-09T01:33:47.12a4Z',
+                      '2019-0a-09T01:33:47Z',
+                      '2019-13-09T01:33:47Z'):
+            # Act
+            with self.assertRaises(ValueError):
+                _parse_iso_z(value, tzutc())
+
+    def test_parse_iso_falls_back_for_other_shapes(self):
+        # Act
+        date = _parse_iso('2019-05-09 01:33:47.1234567Z')
+        naive_date = _parse_iso_ignoretz('2019-05-09T01:33:47.1234567+01:00')
+
+        # Assert
+        self.assertEqual(date, datetime(2019, 5, 9, 1, 33, 47, 123456, tzinfo=tzutc()))
+        self.assertEqual(naive_date, datetime(2019, 5, 9, 1, 33, 47, 123456))
+
+    # --Test cases for parsing booleans -----------------------------------------
+    def test_lookup_bool(self):
+        for value, expected in (('true', True),
+                                ('false', False),
+                                ('True', True),
+                                ('TRUE', True),
+                                ('tRUe', True),
+                                ('False', False),
+                                ('fAlSe', False),
+                                ('', False),
+                                ('yes', False)):
+            # Act
+            result = _lookup_bool(value)
+
+            # Assert
+            self.assertIs(result, expected, value)
+
+    # --Test cases for service properties ---------------------------------------
+    def test_convert_xml_to_service_properties_cors(self):
+        # Act
+        properties = _convert_xml_to_service_properties(HTTPResponse(200, 'OK', {}, SERVICE_PROPERTIES_BODY))
+
+        # Assert
+        self.assertEqual(len(properties.cors), 2)
+        first_rule, second_rule = properties.cors
+        self.assertEqual(first_rule.allowed_origins, ['www.xyz.com', 'www.ab.com', 'www.bc.com'])
+        self.assertEqual(first_rule.allowed_methods, ['GET', 'PUT'])
+        self.assertEqual(first_rule.max_age_in_seconds, 500)
+        self.assertEqual(first_rule.exposed_headers, ['x-ms-meta-data*', 'x-ms-meta-source*', 'x-ms-meta-abc'])
+        self.assertEqual(first_rule.allowed_headers, [])
+        self.assertEqual(second_rule.allowed_origins, ['*'])
+        self.assertEqual(second_rule.allowed_methods, ['GET'])
+        self.assertEqual(second_rule.max_age_in_seconds, 0)
+        self.assertEqual(second_rule.exposed_headers, [])
+        self.assertEqual(second_rule.allowed_headers, ['x-ms-meta-target*'])
+
+    def test_convert_xml_to_service_properties_logging(self):
+        # Act
+        properties = _convert_xml_to_service_properties(HTTPResponse(200, 'OK', {}, SERVICE_PROPERTIES_BODY))
+
+        # Assert
+        self.assertEqual(properties.logging.version, '1.0')
+        self.assertIs(properties.logging.delete, True)
+        self.assertIs(properties.logging.read, False)
+        self.assertIs(properties.logging.write, True)
+        self.assertIs(properties.logging.retention_policy.enabled, False)
+
+
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,171 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import unittest
+
+from azure.storage.common.models import (
+    ListGenerator,
+    _list,
+)
+from azure.storage.file import FileService
+from tests.testcase import (
+    StorageTestCase,
+)
+
+
+# ------------------------------------------------------------------------------
+
+class _FakeListMethod(object):
+    '''
+    Lists the integers below total in segments of segment_size, recording the
+    kwargs of every call.
+    '''
+
+    def __init__(self, total, segment_size, error=None):
+        self.total = total
+        self.segment_size = segment_size
+        self.error = error
+        self.calls = []
+
+    def __call__(self, marker=None, max_results=None, **kwargs):
+        self.calls.append({'marker': marker, 'max_results': max_results})
+        if self.error is not None and marker is not None:
+            raise self.error
+
+        start = int(marker) if marker else 0
+        size = self.segment_size if max_results is None else min(self.segment_size, max_results)
+        end = min(start + size, self.total)
+
+        results = _list(range(start, end))
+        results.next_marker = str(end) if end < self.total else None
+        return results
+
+
+class _FakePagesListMethod(object):
+    '''
+    Lists the given pages in order, each with a marker for the page after it.
+    '''
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    def __call__(self, marker=None, max_results=None, **kwargs):
+        self.calls.append({'marker': marker, 'max_results': max_results})
+
+        index = int(marker) if marker else 0
+        results = _list(self.pages[index])
+        results.next_marker = str(index + 1) if index + 1 < len(self.pages) else None
+        return results
+
+
+class StorageListGeneratorTest(StorageTestCase):
+    def _create_generator(self, list_method, num_results=None, prefetch=False):
+        kwargs = {'marker': None, 'max_results': num_results}
+        resources = list_method(**kwargs)
+        return ListGenerator(resources, list_method, (), kwargs, prefetch=prefetch)
+
+    # --Test cases for ListGenerator ---------------------------------------------
+    def test_list_all_segments(self):
+        for prefetch in (False, True):
+            # Arrange
+            list_method = _FakeListMethod(total=7, segment_size=3)
+
+            # Act
+            generator = self._create_generator(list_method, prefetch=prefetch)
+            results = list(generator)
+
+            # Assert
+            self.assertEqual(results, list(range(7)))
+            self.assertEqual([call['marker'] for call in list_method.calls], [None, '3', '6'])
+            self.assertIsNone(generator.next_marker)
+
+    def test_list_with_num_results(self):
+        for prefetch in (False, True):
+            # Arrange
+            list_method = _FakeListMethod(total=10, segment_size=3)
+
+            # Act
+            generator = self._create_generator(list_method, num_results=5, prefetch=prefetch)
+            results = list(generator)
+
+            # Assert
+            self.assertEqual(results, list(range(5)))
+            self.assertEqual(list_method.calls, [
+                {'marker': None, 'max_results': 5},
+                {'marker': '3', 'max_results': 2},
+            ])
+            self.assertEqual(generator.next_marker, '5')
+
+    def test_list_with_empty_segments(self):
+        for prefetch in (False, True):
+            for pages, expected in (([[], [1, 2], [3]], [1, 2, 3]),
+                                    ([[0], [], [3]], [0, 3]),
+                                    ([[0], [], [], [3], []], [0, 3])):
+                # Arrange
+                list_method = _FakePagesListMethod(pages)
+
+                # Act
+                generator = self._create_generator(list_method, prefetch=prefetch)
+                results = list(generator)
+
+                # Assert
+                self.assertEqual(results, expected)
+                self.assertEqual(len(list_method.calls), len(pages))
+                self.assertIsNone(generator.next_marker)
+
+    def test_list_with_early_break(self):
+        for prefetch in (False, True):
+            # Arrange
+            list_method = _FakeListMethod(total=10, segment_size=3)
+
+            # Act
+            generator = iter(self._create_generator(list_method, prefetch=prefetch))
+            first = next(generator)
+            generator.close()
+
+            # Assert
+            self.assertEqual(first, 0)
+            self.assertEqual(len(list_method.calls), 1)
+
+    def test_list_with_prefetch_raises_next_segment_error(self):
+        # Arrange
+        list_method = _FakeListMethod(total=10, segment_size=3, error=ValueError('next segment failed'))
+        generator = iter(self._create_generator(list_method, prefetch=True))
+
+        # Act
+        results = [next(generator) for _ in range(3)]
+
+        # Assert
+        self.assertEqual(results, [0, 1, 2])
+        with self.assertRaises(ValueError):
+            next(generator)
+
+    def test_list_shares_does_not_prefetch_by_default(self):
+        # Arrange
+        file_service = FileService('account', 'a2V5')
+        list_method = _FakeListMethod(total=10, segment_size=3)
+        file_service._list_shares = list_method
+
+        # Act
+        generator = iter(file_service.list_shares())
+        next(generator)
+        next(generator)
+
+        # Assert
+        self.assertEqual(len(list_method.calls), 1)
+
+        # Act
+        generator = iter(file_service.list_shares(prefetch=True))
+        results = [next(generator) for _ in range(4)]
+
+        # Assert
+        self.assertEqual(results, [0, 1, 2, 3])
+        self.assertEqual(len(list_method.calls), 3)
+
+
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
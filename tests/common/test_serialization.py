@@ -0,0 +1,75 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import unittest
+
+from azure.storage.common import _serialization
+from azure.storage.common._http import HTTPRequest
+from tests.testcase import (
+    StorageTestCase,
+)
+
+
+# ------------------------------------------------------------------------------
+
+class StorageSerializationTest(StorageTestCase):
+    def setUp(self):
+        super(StorageSerializationTest, self).setUp()
+        self.now = 1557365627.25
+
+        # Replace the clock of the module and start without a cached date header
+        original_time = _serialization.time
+        original_date_header = _serialization._last_date_header
+        _serialization.time = lambda: self.now
+        _serialization._last_date_header = (None, None)
+
+        def restore():
+            _serialization.time = original_time
+            _serialization._last_date_header = original_date_header
+
+        self.addCleanup(restore)
+
+    def _add_date_header(self):
+        request = HTTPRequest()
+        _serialization._add_date_header(request)
+        return request.headers['x-ms-date']
+
+    # --Test cases for the date header ------------------------------------------
+    def test_add_date_header(self):
+        # Act
+        date = self._add_date_header()
+
+        # Assert
+        self.assertEqual(date, 'Thu, 09 May 2019 01:33:47 GMT')
+
+    def test_add_date_header_within_same_second(self):
+        # Act
+        first_date = self._add_date_header()
+        cached_date_header = _serialization._last_date_header
+        self.now += 0.7
+        second_date = self._add_date_header()
+
+        # Assert
+        self.assertEqual(first_date, 'Thu, 09 May 2019 01:33:47 GMT')
+        self.assertEqual(second_date, first_date)
+        self.assertIs(_serialization._last_date_header, cached_date_header)
+
+    def test_add_date_header_in_next_second(self):
+        # Act
+        first_date = self._add_date_header()
+        self.now += 1
+        second_date = self._add_date_header()
+        self.now -= 1
+        third_date = self._add_date_header()
+
+        # Assert
+        self.assertEqual(first_date, 'Thu, 09 May 2019 01:33:47 GMT')
+        self.assertEqual(second_date, 'Thu, 09 May 2019 01:33:48 GMT')
+        self.assertEqual(third_date, 'Thu, 09 May 2019 01:33:47 GMT')
+
+
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()
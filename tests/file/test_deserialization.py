@@ -0,0 +1,230 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import unittest
+
+from azure.storage.common._http import HTTPResponse
+from azure.storage.file import (
+    Directory,
+    File,
+)
+from azure.storage.file._deserialization import (
+    _convert_xml_to_shares,
+    _convert_xml_to_directories_and_files,
+    _convert_xml_to_ranges,
+    _convert_xml_to_share_stats,
+)
+from tests.testcase import (
+    StorageTestCase,
+)
+
+# ------------------------------------------------------------------------------
+LIST_SHARES_BODY = b'''<?xml version="1.0" encoding="utf-8"?>
+<EnumerationResults ServiceEndpoint="https://myaccount.file.core.windows.net/">
+  <MaxResults>2</MaxResults>
+  <Shares>
+    <Share>
+      <Name>share1</Name>
+      <Snapshot>2019-05-09T01:33:47.0000000Z</Snapshot>
+      <Properties>
+        <Last-Modified>Thu, 09 May 2019 01:33:47 GMT</Last-Modified>
+        <Etag>"0x8D6D4238B4EF8A1"</Etag>
+        <Quota>5120</Quota>
+      </Properties>
+      <Metadata>
+        <Name>metadata name</Name>
+        <Share>metadata share</Share>
+        <NextMarker>metadata marker</NextMarker>
+      </Metadata>
+    </Share>
+    <Share>
+      <Name>share2</Name>
+      <Properties>
+        <Last-Modified>Thu, 09 May 2019 01:34:47 GMT</Last-Modified>
+        <Etag>"0x8D6D4238B4EF8A2"</Etag>
+        <Quota>1</Quota>
+      </Properties>
+    </Share>
+  </Shares>
+  <NextMarker>share3</NextMarker>
+</EnumerationResults>'''
+
+LIST_DIRECTORIES_AND_FILES_BODY = b'''<?xml version="1.0" encoding="utf-8"?>
+<EnumerationResults ServiceEndpoint="https://myaccount.file.core.windows.net/" ShareName="share1" DirectoryPath="">
+  <Entries>
+    <Directory>
+      <Name>dir1</Name>
+    </Directory>
+    <File>
+      <Name>file1</Name>
+      <Properties>
+        <Content-Length>1024</Content-Length>
+      </Properties>
+    </File>
+    <Directory>
+      <Name>Name</Name>
+    </Directory>
+    <File>
+      <Name>File</Name>
+      <Properties>
+        <Content-Length>0</Content-Length>
+      </Properties>
+    </File>
+  </Entries>
+  <NextMarker />
+</EnumerationResults>'''
+
+COMPACT_RANGES_BODY = b'<?xml version="1.0" encoding="utf-8"?><Ranges>' \
+                      b'<Range><Start>0</Start><End>511</End></Range>' \
+                      b'<Range><Start>1024</Start><End>1535</End></Range></Ranges>'
+
+PRETTY_RANGES_BODY = b'''<?xml version="1.0" encoding="utf-8"?>
+<Ranges>
+  <Range>
+    <Start>0</Start>
+    <End>511</End>
+  </Range>
+  <Range>
+    <Start>1024</Start>
+    <End>1535</End>
+  </Range>
+</Ranges>'''
+
+
+# ------------------------------------------------------------------------------
+
+class StorageFileDeserializationTest(StorageTestCase):
+    def _create_response(self, body):
+        return HTTPResponse(200, 'OK', {}, body)
+
+    # --Test cases for listings ------------------------------------------------
+    def test_convert_xml_to_shares(self):
+        # Act
+        shares = _convert_xml_to_shares(self._create_response(LIST_SHARES_BODY))
+
+        # Assert
+        self.assertEqual(len(shares), 2)
+        self.assertEqual(shares.next_marker, 'share3')
+        self.assertEqual(shares[0].name, 'share1')
+        self.assertEqual(shares[0].snapshot, '2019-05-09T01:33:47.0000000Z')
+        self.assertEqual(shares[0].properties.etag, '"0x8D6D4238B4EF8A1"')
+        self.assertEqual(shares[0].properties.quota, 5120)
+        self.assertEqual(shares[0].properties.last_modified.minute, 33)
+        self.assertEqual(shares[1].name, 'share2')
+        self.assertIsNone(shares[1].snapshot)
+        self.assertEqual(shares[1].properties.quota, 1)
+        self.assertIsNone(shares[1].metadata)
+
+    def test_convert_xml_to_shares_metadata_named_like_elements(self):
+        # Act
+        shares = _convert_xml_to_shares(self._create_response(LIST_SHARES_BODY))
+
+        # Assert
+        self.assertEqual(shares[0].name, 'share1')
+        self.assertEqual(shares[0].metadata, {
+            'Name': 'metadata name',
+            'Share': 'metadata share',
+            'NextMarker': 'metadata marker',
+        })
+        self.assertEqual(shares.next_marker, 'share3')
+
+    def test_convert_xml_to_shares_unicode_body(self):
+        # Act
+        shares = _convert_xml_to_shares(self._create_response(LIST_SHARES_BODY.decode('utf-8')))
+
+        # Assert
+        self.assertEqual([share.name for share in shares], ['share1', 'share2'])
+
+    def test_convert_xml_to_directories_and_files(self):
+        # Act
+        entries = _convert_xml_to_directories_and_files(self._create_response(LIST_DIRECTORIES_AND_FILES_BODY))
+
+        # Assert
+        self.assertIsNone(entries.next_marker)
+        self.assertEqual([entry.name for entry in entries], ['file1', 'File', 'dir1', 'Name'])
+        self.assertIsInstance(entries[0], File)
+        self.assertIsInstance(entries[1], File)
+        self.assertIsInstance(entries[2], Directory)
+        self.assertIsInstance(entries[3], Directory)
+        self.assertEqual(entries[0].properties.content_length, 1024)
+        self.assertEqual(entries[1].properties.content_length, 0)
+
+    # --Test cases for ranges and share stats -----------------------------------
+    def _assert_ranges(self, ranges):
+        self.assertEqual(len(ranges), 2)
+        self.assertEqual((ranges[0].start, ranges[0].end), (0, 511))
+        self.assertEqual((ranges[1].start, ranges[1].end), (1024, 1535))
+
+    def test_convert_xml_to_ranges_compact_body(self):
+        # Act
+        ranges = _convert_xml_to_ranges(self._create_response(COMPACT_RANGES_BODY))
+
+        # Assert
+        self._assert_ranges(ranges)
+
+    def test_convert_xml_to_ranges_pretty_printed_body(self):
+        # Act
+        ranges = _convert_xml_to_ranges(self._create_response(PRETTY_RANGES_BODY))
+
+        # Assert
+        self._assert_ranges(ranges)
+
+    def test_convert_xml_to_ranges_unicode_body(self):
+        # Act
+        compact_ranges = _convert_xml_to_ranges(self._create_response(COMPACT_RANGES_BODY.decode('utf-8')))
+        pretty_ranges = _convert_xml_to_ranges(self._create_response(PRETTY_RANGES_BODY.decode('utf-8')))
+
+        # Assert
+        self._assert_ranges(compact_ranges)
+        self._assert_ranges(pretty_ranges)
+
+    def test_convert_xml_to_ranges_partially_compact_body(self):
+        # Arrange
+        body = b'<?xml version="1.0" encoding="utf-8"?><Ranges>' \
+               b'<Range><Start>0</Start><End>511</End></Range>' \
+               b'<Range>\n<Start>1024</Start>\n<End>1535</End>\n</Range></Ranges>'
+
+        # Act
+        ranges = _convert_xml_to_ranges(self._create_response(body))
+
+        # Assert
+        self._assert_ranges(ranges)
+
+    def test_convert_xml_to_ranges_empty_body(self):
+        # Act
+        ranges = _convert_xml_to_ranges(self._create_response(b'<?xml version="1.0" encoding="utf-8"?><Ranges />'))
+
+        # Assert
+        self.assertEqual(ranges, [])
+
+    def test_convert_xml_to_share_stats(self):
+        # Arrange
+        body = b'<?xml version="1.0" encoding="utf-8"?><ShareStats><ShareUsageBytes>15</ShareUsageBytes></ShareStats>'
+
+        # Act
+        share_usage = _convert_xml_to_share_stats(self._create_response(body))
+        unicode_share_usage = _convert_xml_to_share_stats(self._create_response(body.decode('utf-8')))
+
+        # Assert
+        self.assertEqual(share_usage, 15)
+        self.assertEqual(unicode_share_usage, 15)
+
+    def test_convert_xml_to_share_stats_without_match(self):
+        # Arrange
+        body = b'<?xml version="1.0" encoding="utf-8"?>\n<ShareStats>\n  <ShareUsageBytes>\n    15\n  ' \
+               b'</ShareUsageBytes>\n</ShareStats>'
+
+        # Act
+        share_usage = _convert_xml_to_share_stats(self._create_response(body))
+
+        # Assert
+        self.assertEqual(share_usage, 15)
+
+
+# ------------------------------------------------------------------------------
+if __name__ == '__main__':
+    unittest.main()